@@ -1,5 +1,5 @@
 from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
 import boto3
@@ -31,6 +31,17 @@ app.add_middleware(
 s3_client = boto3.client('s3')
 graph = create_graph()
 
+# Static endpoint payloads - serialized once at import instead of per request
+HEALTH_JSON = json.dumps({"status": "ok", "service": "Mavik AI Assistant"}).encode()
+ROOT_JSON = json.dumps({
+    "service": "Mavik AI Assistant",
+    "version": "1.0.0",
+    "endpoints": {
+        "/api/chat": "Main chat endpoint (POST)",
+        "/health": "Health check (GET)"
+    }
+}).encode()
+
 @app.post("/api/chat")
 async def chat_endpoint(
     message: str = Form(...),
@@ -161,18 +172,11 @@ async def chat_endpoint(
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "service": "Mavik AI Assistant"}
+    return Response(content=HEALTH_JSON, media_type="application/json")
 
 @app.get("/")
 async def root():
-    return {
-        "service": "Mavik AI Assistant",
-        "version": "1.0.0",
-        "endpoints": {
-            "/api/chat": "Main chat endpoint (POST)",
-            "/health": "Health check (GET)"
-        }
-    }
+    return Response(content=ROOT_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,18 +1,34 @@
 import boto3
 import os
-from typing import Dict, List, Any
+from typing import Dict, Any
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class DocumentParser:
-    def __init__(self):
+    def __init__(
+        self,
+        min_poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        poll_backoff: float = 1.5
+    ):
         self.textract = boto3.client(
             'textract',
             region_name=os.getenv('AWS_REGION', 'us-east-1'),
             aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
             aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
         )
+        self.s3_client = boto3.client(
+            's3',
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+        )
+
+        # Textract polling schedule (seconds) - raise if many jobs share the account's Get* TPS quota
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
 
     async def extract_pdf_text(self, s3_url: str, progress_callback=None) -> Dict[str, Any]:
         """Extract text and tables from PDF using AWS Textract
@@ -23,6 +39,7 @@ class DocumentParser:
         """
         import time
         import asyncio
+        import random
 
         # Parse S3 URL
         # s3://bucket-name/key
@@ -35,15 +52,11 @@ class DocumentParser:
 
         print(f"DEBUG: Extracting PDF from bucket={bucket}, key={key}")
 
-        # Verify S3 object exists before starting Textract
+        # Verify S3 object exists before starting Textract. boto3 calls block, so
+        # they run in a worker thread here and below to keep the event loop free
+        # for other chat requests while this job is polled.
         try:
-            s3_client = boto3.client(
-                's3',
-                region_name=os.getenv('AWS_REGION', 'us-east-1'),
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-            )
-            s3_client.head_object(Bucket=bucket, Key=key)
+            await asyncio.to_thread(self.s3_client.head_object, Bucket=bucket, Key=key)
             print(f"DEBUG: S3 object verified: s3://{bucket}/{key}")
         except Exception as e:
             raise Exception(f"S3 object not accessible: {e}")
@@ -53,7 +66,8 @@ class DocumentParser:
 
         # Start document analysis
         try:
-            response = self.textract.start_document_analysis(
+            response = await asyncio.to_thread(
+                self.textract.start_document_analysis,
                 DocumentLocation={'S3Object': {'Bucket': bucket, 'Name': key}},
                 FeatureTypes=['TABLES']
             )
@@ -69,34 +83,33 @@ class DocumentParser:
 
         # Wait for job to complete (with more aggressive polling)
         max_wait_time = 600  # 10 minutes for large documents
-        start_time = time.time()
+        start_time = time.monotonic()
         check_count = 0
 
-        # Start with 2 second checks, increase to 5 seconds after 30 seconds
-        poll_interval = 2
+        # Exponential backoff: pick up short jobs within a second or two, then
+        # back off so long jobs don't burn GetDocumentAnalysis calls
+        poll_interval = self.min_poll_interval
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
 
             if elapsed > max_wait_time:
                 raise Exception(f'Textract job timed out after {int(elapsed)}s')
 
-            await asyncio.sleep(poll_interval)
+            # Jitter keeps concurrent jobs from polling in lockstep
+            await asyncio.sleep(poll_interval + random.uniform(0, poll_interval * 0.1))
             check_count += 1
+            poll_interval = min(poll_interval * self.poll_backoff, self.max_poll_interval)
 
-            # Increase poll interval after 30 seconds to reduce API calls
-            if elapsed > 30:
-                poll_interval = 5
-
-            response = self.textract.get_document_analysis(JobId=job_id)
+            response = await asyncio.to_thread(self.textract.get_document_analysis, JobId=job_id)
             status = response['JobStatus']
 
             # More verbose logging
             if check_count % 5 == 0 or status in ['SUCCEEDED', 'FAILED']:
                 print(f"DEBUG: Textract status: {status} (elapsed: {int(elapsed)}s, checks: {check_count})")
 
-            # Call progress callback on every check to keep connection alive
-            if progress_callback and check_count % 2 == 0:  # Every 2 checks (4-10 seconds)
+            # Call progress callback on every check to keep connection alive (1-10 seconds)
+            if progress_callback:
                 await progress_callback(f"Processing document... ({int(elapsed)}s elapsed)")
 
             if status in ['SUCCEEDED', 'FAILED']:
@@ -110,25 +123,35 @@ class DocumentParser:
         text = []
         tables = []
 
-        # Handle pagination for large documents
+        # Handle pagination for large documents. A table's CELL/WORD children can
+        # land on a later result page than the TABLE block itself, so the block
+        # map spans all pages and tables are resolved once pagination is done.
+        block_map = {}
+        table_blocks = []
         next_token = None
         while True:
             if next_token:
-                response = self.textract.get_document_analysis(
+                response = await asyncio.to_thread(
+                    self.textract.get_document_analysis,
                     JobId=job_id,
                     NextToken=next_token
                 )
 
+            # Single pass: index blocks by Id and classify them at the same time
             for block in response.get('Blocks', []):
+                block_map[block['Id']] = block
                 if block['BlockType'] == 'LINE':
                     text.append(block.get('Text', ''))
                 elif block['BlockType'] == 'TABLE':
-                    tables.append(self._extract_table(block, response['Blocks']))
+                    table_blocks.append(block)
 
             next_token = response.get('NextToken')
             if not next_token:
                 break
 
+        for table_block in table_blocks:
+            tables.append(self._extract_table(table_block, block_map))
+
         print(f"DEBUG: Extracted {len(text)} lines and {len(tables)} tables")
 
         return {
@@ -136,11 +159,10 @@ class DocumentParser:
             'tables': tables
         }
 
-    def _extract_table(self, table_block: Dict, all_blocks: List[Dict]) -> Dict:
+    def _extract_table(self, table_block: Dict, block_map: Dict) -> Dict:
         """Extract table structure from Textract blocks"""
 
         table_data = []
-        block_map = {block['Id']: block for block in all_blocks}
 
         for relationship in table_block.get('Relationships', []):
             if relationship['Type'] == 'CHILD':
@@ -167,15 +189,15 @@ class DocumentParser:
     def _get_cell_text(self, cell_block: Dict, block_map: Dict) -> str:
         """Get text from a cell"""
 
-        text = ''
+        words = []
         for relationship in cell_block.get('Relationships', []):
             if relationship['Type'] == 'CHILD':
                 for child_id in relationship['Ids']:
                     word = block_map.get(child_id)
                     if word and word['BlockType'] == 'WORD':
-                        text += word.get('Text', '') + ' '
+                        words.append(word.get('Text', ''))
 
-        return text.strip()
+        return ' '.join(words).strip()
 
 # Global instance
 doc_parser = DocumentParser()
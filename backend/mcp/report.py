@@ -3,6 +3,7 @@ from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from typing import List, Dict, Any
 import boto3
+import io
 import os
 import uuid
 from dotenv import load_dotenv
@@ -61,15 +62,14 @@ class ReportGenerator:
                 content_para = doc.add_paragraph(section['content'])
                 content_para.paragraph_format.space_after = Pt(12)
 
-        # Save to temp file (Windows-compatible)
-        import tempfile
-        temp_dir = tempfile.gettempdir()
-        temp_filename = os.path.join(temp_dir, f"{uuid.uuid4()}.docx")
-        doc.save(temp_filename)
+        # Save to an in-memory buffer - nothing to clean up if the upload fails
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
 
         # Upload to S3
         s3_key = f"reports/{uuid.uuid4()}.docx"
-        self.s3_client.upload_file(temp_filename, self.bucket, s3_key)
+        self.s3_client.upload_fileobj(buffer, self.bucket, s3_key)
 
         # Generate presigned URL (valid for 7 days)
         url = self.s3_client.generate_presigned_url(
@@ -78,9 +78,6 @@ class ReportGenerator:
             ExpiresIn=604800  # 7 days
         )
 
-        # Clean up temp file
-        os.remove(temp_filename)
-
         return url
 
     def _add_markdown_to_doc(self, doc: Document, markdown_text: str):
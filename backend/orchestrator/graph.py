@@ -8,6 +8,13 @@ from prompts.system import QA_SYSTEM_PROMPT, CALCULATION_SYSTEM_PROMPT
 from typing import Dict, Any
 import time
 
+# Keywords that mark a document question as a structured financial extraction
+# (long output - streamed, and answered with the extraction prompt)
+FINANCIAL_EXTRACTION_KEYWORDS = (
+    'extract key data', 'key terms', 'accounting', 'financial data points',
+    'structured extraction', 'downstream accounting', 'loan terms'
+)
+
 async def extract_pdf(state: OrchestratorState) -> OrchestratorState:
     """Extract text from PDF using Textract"""
 
@@ -230,10 +237,7 @@ async def generate_response(state: OrchestratorState) -> OrchestratorState:
         prompt = build_document_qa_prompt(state)
 
         # Check if this is a financial extraction (might be long) - use streaming
-        if any(keyword in state['user_message'].lower() for keyword in [
-            'extract key data', 'key terms', 'accounting', 'financial data points',
-            'structured extraction', 'downstream accounting', 'loan terms'
-        ]):
+        if any(keyword in state['user_message'].lower() for keyword in FINANCIAL_EXTRACTION_KEYWORDS):
             # Use streaming for comprehensive extraction to avoid truncation
             full_response = ""
             async for chunk in invoke_claude_streaming(prompt, QA_SYSTEM_PROMPT):
@@ -387,10 +391,7 @@ def build_document_qa_prompt(state: OrchestratorState) -> str:
     user_message_lower = state['user_message'].lower()
 
     # Check if this is an accounting/financial extraction request
-    is_financial_extraction = any(keyword in user_message_lower for keyword in [
-        'extract key data', 'key terms', 'accounting', 'financial data points',
-        'structured extraction', 'downstream accounting', 'loan terms'
-    ])
+    is_financial_extraction = any(keyword in user_message_lower for keyword in FINANCIAL_EXTRACTION_KEYWORDS)
 
     prompt = f"USER QUESTION: {state['user_message']}\n\n"
 